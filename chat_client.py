@@ -1,12 +1,53 @@
+import os
+import selectors
 import socket
 import threading
 import sys
-from typing import Optional, List
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
 
 
 HOST = "192.168.50.57"
 PORT = 9000
 
+# Protocol constants, built once at import time.
+# Received lines are parsed as bytes, so these are compared without decoding the line first.
+_HELLO = b"HELLO "
+_TO = b"TO "
+_END = b"END "
+_END_LEN = len(_END)
+_SP = b" "
+_NL = b"\n"
+_CR = b"\r"
+
+# Command tags (first word of a server line)
+_FROM = b"FROM"
+_SYS = b"SYS"
+_ERR = b"ERR"
+
+# Pieces of: ERR User '<name>' not found / ERR User '<name>' disconnected
+_USER = b"User '"
+_USER_LEN = len(_USER)
+_NOTFOUND = b"' not found"
+_DISC = b"' disconnected"
+
+# Size of a single recv_into() call: starts at 8 KiB and adapts to the traffic within these bounds
+_RECV_MIN = 8192
+_RECV_MAX = 65536
+
+# How long the HELLO reply may stay without its '\n' before the received part is taken as the reply
+_REPLY_TIMEOUT = 2.0
+
+# sendmsg() (scatter/gather send) is not available on every platform (e.g. Windows)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# select()/epoll/kqueue can wait on stdin only on POSIX; on Windows they accept sockets only
+_SELECT_STDIN = sys.platform != "win32"
+
+# First characters a CLI command can start with (TO / END / exit / quit, any case).
+# Input starting with anything else is always a plain chat message.
+_COMMAND_START = frozenset("TtEeQq")
+
 
 class ChatClient:
     """
@@ -40,10 +81,13 @@ class ChatClient:
 
         # Shared state between the main thread (user input / sending)
         # and the receiver thread (listening for server messages).
+        # The lock guards updates that touch more than one field (_current_target + _target_stack);
+        # reading a single attribute is atomic in CPython and does not need it.
         self._lock = threading.Lock()
 
-        # Connection flag: True only after successfully connecting + completing HELLO handshake
-        self._connected: bool = False
+        # Connection flag: set only after successfully connecting + completing HELLO handshake.
+        # An Event is safe to set/clear/check from both threads without taking `_lock`.
+        self._connected = threading.Event()
 
         # The active chat target (chat-mode).
         # If None, the client is not currently chatting with anyone.
@@ -54,11 +98,50 @@ class ChatClient:
 
         # History stack of previous targets.
         # Used to "go back" to the previous chat when END is called (or when a user disconnects).
-        self._target_stack: List[str] = []
+        # Bounded: if more than 64 chats are stacked, the oldest ones are dropped.
+        self._target_stack: Deque[str] = deque(maxlen=64)
 
         # Client's name (sent to the server during HELLO handshake)
         self.name: str = ""
 
+        # Receive buffer reused for every recv_into() call (line framing of everything the server sends).
+        # buf[_recv_start:_recv_end] holds bytes received but not yet consumed as complete lines;
+        # buf[_recv_start:_recv_scan] is already known to contain no newline.
+        self._recv_buf = bytearray(_RECV_MIN)
+        self._recv_start = 0
+        self._recv_scan = 0
+        self._recv_end = 0
+
+        # Current recv_into() size. Doubled after 3 reads in a row fill it completely (burst / backlog),
+        # halved after 3 reads in a row use less than a quarter of it (back to interactive traffic).
+        self._recv_size = _RECV_MIN
+        self._recv_full_reads = 0
+        self._recv_small_reads = 0
+
+        # Outgoing buffer reused for every line: the pieces of a line are appended to it and the
+        # whole pending content is written at once. With the non-blocking socket of the selector
+        # loop, bytes the kernel did not accept yet stay here until the socket is writable again.
+        self._send_scratch = bytearray()
+
+        # Selector of the single-threaded CLI loop (None while the socket is in blocking mode)
+        self._selector: Optional[selectors.BaseSelector] = None
+
+        # Bytes read from stdin that do not form a complete line yet (selector loop only)
+        self._stdin_buf = bytearray()
+
+        # Encoded "TO <target> " prefix of the active chat, rebuilt only when the target changes,
+        # so the steady-state "chatting with X" path does not re-encode the name for every message.
+        self._prefix_target: Optional[str] = None
+        self._prefix = b""
+
+        # Receiver dispatch table: command tag (first word of a server line) -> handler.
+        # Lines with any other tag are simply printed.
+        self._handlers: Dict[bytes, Callable[[bytes], bool]] = {
+            _FROM: self._on_from,
+            _SYS: self._on_sys,
+            _ERR: self._on_err,
+        }
+
     # ----------------------------
     # Connection / Handshake
     # ----------------------------
@@ -79,10 +162,18 @@ class ChatClient:
             print(f"[System] Connection failed: {e}")
             return False
 
+        # Interactive traffic: every line should leave immediately instead of waiting for
+        # Nagle's algorithm to coalesce it with the next write (up to ~40ms extra latency).
+        # Keepalive lets the OS detect a peer that vanished without closing the connection.
+        try:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            # Not fatal: the connection still works with the default socket options
+            pass
+
         # Mark client as connected (shared state used by multiple threads).
-        # We lock because the receiver thread / main thread may read this flag too.
-        with self._lock:
-            self._connected = True
+        self._connected.set()
         return True
 
     def handshake(self, name: str) -> str:
@@ -115,12 +206,12 @@ class ChatClient:
 
         # Send HELLO command to the server.
         # If sending fails, it usually means the connection is broken.
-        if not self._safe_send(f"HELLO {name}\n"):
+        if not self._safe_send(_HELLO, name.encode("utf-8"), _NL):
             return "EXIT"
 
-        # Receive the server reply (OK / ERR / etc.)
+        # Receive the server reply (OK / ERR / etc.) - exactly one line, however long
         try:
-            reply = self.sock.recv(1024).decode("utf-8", errors="ignore").strip()
+            reply = self._read_line().decode("utf-8", errors="ignore").strip()
         except OSError as e:
             # Socket error while receiving
             # disconnect
@@ -160,6 +251,9 @@ class ChatClient:
 
            The thread runs as a daemon so it won't prevent the program from exiting
            when the main thread finishes.
+
+           Used by `run_cli` only where stdin cannot be watched by a selector (e.g. Windows);
+           otherwise the CLI loop receives messages itself.
         """
 
         t = threading.Thread(target=self._recv_loop, daemon=True)
@@ -175,17 +269,22 @@ class ChatClient:
            this function called when we detect that the server connection is broken (recv/send error).
            We clear current chat information because it is no longer valid once disconnected.
         """
+        self._connected.clear()
         with self._lock:
-            self._connected = False
             self._current_target = None
             self._target_stack.clear()
 
-    def _safe_send(self, text: str) -> bool:
+    def _safe_send(self, *chunks: bytes) -> bool:
         """
            Send data to the server safely.
 
            Args:
-               text (str): The text to send (should include '\n' at the end for line-based protocol).
+               *chunks (bytes): Encoded pieces of the line to send (the last one should end with '\n'
+                                for the line-based protocol). If nothing is pending they are
+                                written with one sendmsg() call; otherwise (or for whatever
+                                sendmsg() did not accept) they are appended to the outgoing
+                                buffer and written together with anything still pending.
+                                Without chunks, only the pending output is written.
 
            Returns:
                bool: True if send succeeded, False if the connection is lost.
@@ -194,14 +293,197 @@ class ChatClient:
                If sending fails (broken pipe / reset / socket error), we update the state to
                disconnected and return False so the caller can stop the program gracefully.
         """
+        scratch = self._send_scratch
         try:
-            self.sock.sendall(text.encode("utf-8"))
+            if chunks and not scratch and _HAS_SENDMSG:
+                self._gather_send(chunks)
+            else:
+                for chunk in chunks:
+                    scratch += chunk
+            self._flush()
             return True
         except (BrokenPipeError, ConnectionResetError, OSError):
+            scratch.clear()
             self._set_disconnected()
             print("[System] Failed to send (connection lost).")
             return False
 
+    def _gather_send(self, chunks: Tuple[bytes, ...]) -> None:
+        """
+           Hand the pieces of a line to the kernel in a single sendmsg() call (scatter/gather),
+           so they never have to be joined or copied into the outgoing buffer first.
+
+           sendmsg() may accept only part of the data: the unsent rest is appended to the
+           outgoing buffer, where `_flush` picks it up.
+
+           Raises:
+               OSError: If the socket fails while sending (handled by `_safe_send`).
+        """
+        try:
+            sent = self.sock.sendmsg(chunks)
+        except BlockingIOError:
+            sent = 0
+
+        scratch = self._send_scratch
+        for chunk in chunks:
+            if sent >= len(chunk):
+                sent -= len(chunk)
+                continue
+            scratch += memoryview(chunk)[sent:]
+            sent = 0
+
+    def _flush(self) -> None:
+        """
+           Write the pending content of the outgoing buffer to the socket.
+
+           The bytearray is passed to the socket as-is (buffer protocol), so no temporary
+           bytes object is created.
+           - Blocking socket: sendall() itself retries partial writes.
+           - Non-blocking socket (selector loop): send() writes what the kernel accepts now; the
+             rest stays in the buffer and EVENT_WRITE is watched only while something is left.
+
+           Raises:
+               OSError: If the socket fails while sending (handled by `_safe_send`).
+        """
+        buf = self._send_scratch
+        if self._selector is None:
+            if buf:
+                self.sock.sendall(buf)
+                buf.clear()
+            return
+
+        if buf:
+            try:
+                sent = self.sock.send(buf)
+            except BlockingIOError:
+                sent = 0
+            del buf[:sent]
+
+        events = selectors.EVENT_READ | selectors.EVENT_WRITE if buf else selectors.EVENT_READ
+        if self._selector.get_key(self.sock).events != events:
+            self._selector.modify(self.sock, events)
+
+    def _recv_some(self) -> int:
+        """
+           Read once from the socket into the receive buffer and adapt the read size.
+
+           Unconsumed bytes are first moved to the front of the buffer (in place, the buffer keeps
+           its length). The buffer is doubled only if the bytes kept plus the current read size do
+           not fit, and trimmed back to twice the read size once it is empty (e.g. after a very
+           long line).
+
+           Returns:
+               int: Number of bytes received (0 means the server closed the connection).
+
+           Raises:
+               OSError: If the socket fails while receiving.
+        """
+        buf = self._recv_buf
+        start = self._recv_start
+        if start:
+            end = self._recv_end
+            if end > start:
+                with memoryview(buf) as view:
+                    view[:end - start] = view[start:end]
+            self._recv_start = 0
+            self._recv_scan -= start
+            self._recv_end = end - start
+        end = self._recv_end
+
+        size = self._recv_size
+        if not end and len(buf) > 2 * size:
+            del buf[2 * size:]
+        elif end + size > len(buf):
+            new_len = len(buf)
+            while end + size > new_len:
+                new_len *= 2
+            buf.extend(bytes(new_len - len(buf)))
+
+        with memoryview(buf) as view:
+            n = self.sock.recv_into(view[end:end + size])
+        self._recv_end = end + n
+
+        # Adapt the read size (bounded by _RECV_MIN / _RECV_MAX)
+        if n == size:
+            self._recv_small_reads = 0
+            self._recv_full_reads += 1
+            if self._recv_full_reads >= 3 and size < _RECV_MAX:
+                self._recv_size = size * 2
+                self._recv_full_reads = 0
+        elif n < size // 4:
+            self._recv_full_reads = 0
+            self._recv_small_reads += 1
+            if self._recv_small_reads >= 3 and size > _RECV_MIN:
+                self._recv_size = size // 2
+                self._recv_small_reads = 0
+        else:
+            self._recv_full_reads = self._recv_small_reads = 0
+
+        return n
+
+    def _next_line(self) -> Optional[bytes]:
+        """
+           Take the next complete line out of the receive buffer.
+
+           Returns:
+               Optional[bytes]: The line without its '\n', or None if no complete line is buffered yet.
+        """
+        buf = self._recv_buf
+        nl = buf.find(_NL, self._recv_scan, self._recv_end)
+        if nl < 0:
+            # Remember how far we looked, so the next search only covers newly received bytes
+            self._recv_scan = self._recv_end
+            return None
+
+        with memoryview(buf) as view:
+            line = view[self._recv_start:nl].tobytes()
+        self._recv_start = self._recv_scan = nl + 1
+        return line
+
+    def _take_buffered(self) -> bytes:
+        """
+           Take everything still held in the receive buffer, even without a '\n', and empty it.
+
+           Returns:
+               bytes: The unconsumed bytes (b"" if there are none).
+        """
+        with memoryview(self._recv_buf) as view:
+            rest = view[self._recv_start:self._recv_end].tobytes()
+        self._recv_start = self._recv_scan = self._recv_end = 0
+        return rest
+
+    def _read_line(self) -> bytes:
+        """
+           Block until one line is received (used for the HELLO reply).
+
+           The reply is expected to end with '\n', but an unterminated reply is not lost:
+           - the server closes the connection (e.g. "ERR Server full" then close) -> the received
+             bytes are returned as the reply;
+           - nothing more arrives for _REPLY_TIMEOUT seconds after a partial reply -> same.
+           While nothing at all has been received, it keeps waiting (like a plain blocking recv).
+
+           Returns:
+               bytes: The line without its '\n', or b"" if the server closed the connection
+                      without sending anything.
+
+           Raises:
+               OSError: If the socket fails while receiving.
+        """
+        self.sock.settimeout(_REPLY_TIMEOUT)
+        try:
+            while True:
+                line = self._next_line()
+                if line is not None:
+                    return line
+                try:
+                    if not self._recv_some():
+                        return self._take_buffered()
+                except TimeoutError:
+                    if self._recv_end > self._recv_start:
+                        return self._take_buffered()
+        finally:
+            self.sock.settimeout(None)
+
     def _recv_loop(self) -> None:
         """
         Background receiver loop (runs in a daemon thread).
@@ -217,102 +499,165 @@ class ChatClient:
         If the socket is closed or a network error occurs, the client is marked as disconnected
         and the receiver thread exits.
         """
-        buffer = ""  # TCP stream buffer (recv may return partial/multiple lines)
+        try:
+            while True:
+                # TCP stream: recv may return partial/multiple lines, so take one complete line at a time
+                raw = self._next_line()
+                if raw is None:
+                    # No complete line buffered -> read more from the server (blocking call)
+                    if not self._recv_some():
+                        break
+                    continue
 
-        while True:
-            try:
-                # Read raw bytes from the server (blocking call)
-                data = self.sock.recv(1024)
-            except OSError:
-                # Socket error => treat as unexpected disconnect
-                self._set_disconnected()
-                print("[System] Disconnected from server (socket error).")
-                break
+                self._handle_line(raw)
+        except OSError:
+            # Socket error => treat as unexpected disconnect
+            self._connection_lost("[System] Disconnected from server (socket error).")
+            return
 
-            if not data:
-                # Server closed the connection (recv returned 0 bytes)
-                self._set_disconnected()
-                print("[System] Server closed the connection.")
-                break
+        # Server closed the connection (EOF: recv returned 0 bytes)
+        self._connection_lost("[System] Server closed the connection.")
 
-            # Append received bytes to buffer and decode as UTF-8
-            buffer += data.decode("utf-8", errors="ignore")
+    def _connection_lost(self, message: str) -> None:
+        """
+        Mark the client as disconnected after a receive error / EOF and tell the user why.
 
-            # Process complete lines (newline-delimited protocol)
-            while "\n" in buffer:
-                line, buffer = buffer.split("\n", 1)
-                line = line.strip()
-                if not line:
-                    continue
+        Args:
+            message (str): The message to print.
+        """
+        # We closed the connection ourselves (close()) -> nothing to report
+        if not self.is_connected():
+            return
+        self._set_disconnected()
+        print(message)
 
-                # Incoming message does NOT auto-switch the active chat that means that if Client1 wants
-                # to talk with Client2 and Client2 wants to replay to Client1 he needs to type TO Client1
-                # The user must explicitly choose who to talk to using: TO <sender>
-                if line.startswith("FROM "):
-                    parts = line.split(" ", 2)  # ["FROM", "Client1", "hello ..."]
-                    sender = parts[1].strip() if len(parts) >= 2 else ""
-                    if sender:
-                        print(f"[System] New message from {sender}. Use: TO {sender} to reply.")
-
-                # System notification: SYS END <sender>
-                # Meaning: the other client (sender) ended the chat on their side and the server notifies us.
-                if line.startswith("SYS END "):
-                    sender = line[len("SYS END "):].strip()
-                    # We lock because _current_target and _target_stack are shared between threads
-                    # (main thread may read/write them while this receiver thread updates them).
-                    with self._lock:
-                        # If we are currently chatting with the sender who ended the chat,
-                        # we must close this chat-mode locally as well.
-                        if self._current_target == sender:
-
-                            # If we have a previous chat in the stack, return to it automatically.
-                            # Example: Client2 was chatting with Client1 -> switched to Client3 -> END with Client3
-                            # Then go back to Client1.
-                            if self._target_stack:
-                                back_to = self._target_stack.pop()
-                                self._current_target = back_to
-                                print(f"[System] {sender} ended the chat. Back to chat with {back_to}.")
-
-                            # Otherwise, there is no previous chat to return to, so we exit chaא.
-                            else:
-                                self._current_target = None
-                                print(f"[System] {sender} ended the chat. Chat closed.")
-                        # If we were NOT chatting with that sender, this is just an informational message.
-                        # (e.g., we ended a different chat, or sender ended a chat that isn't currently active for us)
-                        else:
-                            print(f"[System] {sender} ended the chat.")
-                    continue
+    def _handle_line(self, raw: bytes) -> None:
+        """
+        Handle one complete line received from the server (without its '\n').
+
+        Special protocol messages go to their handler (_on_from / _on_sys / _on_err);
+        everything else is printed as-is.
+
+        Args:
+            raw (bytes): The received line.
+        """
+        # The line stays bytes while it is parsed; it is decoded only for printing.
+        # Lines are already split on '\n'; only a trailing '\r' (CRLF servers) needs removing.
+        line = raw.rstrip(_CR)
+        if not line:
+            return
+
+        # Split once on the first space and dispatch on the command tag (FROM / SYS / ERR).
+        # A handler returns True if the raw server line should still be printed.
+        tag, _, rest = line.partition(_SP)
+        handler = self._handlers.get(tag)
+        if handler is not None and not handler(rest):
+            return
+
+        # Print the raw server line too (ERR / FROM / SENT / etc.)
+        print(line.decode("utf-8", errors="ignore"))
+
+    def _on_from(self, rest: bytes) -> bool:
+        """
+        Handle an incoming message notification: FROM <sender> <message>
+
+        Incoming message does NOT auto-switch the active chat that means that if Client1 wants
+        to talk with Client2 and Client2 wants to replay to Client1 he needs to type TO Client1
+        The user must explicitly choose who to talk to using: TO <sender>
+
+        Args:
+            rest (bytes): The line without the "FROM " tag ("<sender> <message>").
+
+        Returns:
+            bool: True -> the raw line is printed as well.
+        """
+        sender, _, _ = rest.partition(_SP)  # b"Client1", b" ", b"hello ..."
+        sender = sender.strip().decode("utf-8", errors="ignore")
+        if sender:
+            print(f"[System] New message from {sender}. Use: TO {sender} to reply.")
+        return True
+
+    def _on_sys(self, rest: bytes) -> bool:
+        """
+        Handle a system notification: SYS END <sender>
+
+        Meaning: the other client (sender) ended the chat on their side and the server notifies us.
+
+        Args:
+            rest (bytes): The line without the "SYS " tag (e.g. "END Client1").
+
+        Returns:
+            bool: False for SYS END (fully handled here), True for any other SYS line.
+        """
+        if not rest.startswith(_END):
+            return True
+
+        sender = rest[_END_LEN:].strip().decode("utf-8", errors="ignore")
+        # We lock because _current_target and _target_stack are shared between threads
+        # (main thread may read/write them while this receiver thread updates them).
+        with self._lock:
+            # If we are currently chatting with the sender who ended the chat,
+            # we must close this chat-mode locally as well.
+            if self._current_target == sender:
+
+                # If we have a previous chat in the stack, return to it automatically.
+                # Example: Client2 was chatting with Client1 -> switched to Client3 -> END with Client3
+                # Then go back to Client1.
+                if self._target_stack:
+                    back_to = self._target_stack.pop()
+                    self._current_target = back_to
+                    print(f"[System] {sender} ended the chat. Back to chat with {back_to}.")
+
+                # Otherwise, there is no previous chat to return to, so we exit chaא.
+                else:
+                    self._current_target = None
+                    print(f"[System] {sender} ended the chat. Chat closed.")
+            # If we were NOT chatting with that sender, this is just an informational message.
+            # (e.g., we ended a different chat, or sender ended a chat that isn't currently active for us)
+            else:
+                print(f"[System] {sender} ended the chat.")
+        return False
+
+    def _on_err(self, rest: bytes) -> bool:
+        """
+        Handle a server error line: ERR ...
+
+        If the server reports that a user is unavailable and we are currently chatting with them,
+        we close the current chat-mode locally (because sending to them will no longer work).
 
-                # If the server reports that a user is unavailable and we are currently chatting with them,
-                # we close the current chat-mode locally (because sending to them will no longer work).
-
-                # Examples of server messages this handles:
-                #   ERR User 'Client3' not found
-                #   ERR User 'Client3' disconnected
-                if line.startswith("ERR User '") and ("' not found" in line or "' disconnected" in line):
-                    try:
-                        # Extract the username from the error message between quotes: '...'
-                        user = line.split("'", 2)[1]
-                    except Exception:
-                        user = None
-
-                    if user:
-                        # Lock because _current_target and _target_stack are shared state between threads.
-                        with self._lock:
-                            # Only close chat if the unavailable user is our current active target.
-                            if self._current_target == user:
-                                # If we have a previous target stored, return to it automatically.
-                                if self._target_stack:
-                                    back_to = self._target_stack.pop()
-                                    self._current_target = back_to
-                                    print(f"[System] Chat closed: {user} is unavailable. Back to chat with {back_to}.")
-                                # Otherwise, there is no previous chat to return to -> exit chat-mode.
-                                else:
-                                    self._current_target = None
-                                    print(f"[System] Chat closed: {user} is unavailable.")
-
-                # Print the raw server line too (ERR / FROM / SENT / etc.)
-                print(line)
+        Examples of server messages this handles:
+          ERR User 'Client3' not found
+          ERR User 'Client3' disconnected
+
+        Args:
+            rest (bytes): The line without the "ERR " tag.
+
+        Returns:
+            bool: True -> the raw line is printed as well.
+        """
+        if not (rest.startswith(_USER) and (_NOTFOUND in rest or _DISC in rest)):
+            return True
+
+        # Extract the username from the error message between quotes: '...'
+        # (rest starts with "User '", so the name is everything up to the next quote)
+        user, _, _ = rest[_USER_LEN:].partition(b"'")
+        user = user.decode("utf-8", errors="ignore")
+
+        if user:
+            # Lock because _current_target and _target_stack are shared state between threads.
+            with self._lock:
+                # Only close chat if the unavailable user is our current active target.
+                if self._current_target == user:
+                    # If we have a previous target stored, return to it automatically.
+                    if self._target_stack:
+                        back_to = self._target_stack.pop()
+                        self._current_target = back_to
+                        print(f"[System] Chat closed: {user} is unavailable. Back to chat with {back_to}.")
+                    # Otherwise, there is no previous chat to return to -> exit chat-mode.
+                    else:
+                        self._current_target = None
+                        print(f"[System] Chat closed: {user} is unavailable.")
+        return True
 
     # ----------------------------
     # Chat state operations
@@ -324,8 +669,7 @@ class ChatClient:
            Returns:
                bool: True if connected, False otherwise.
         """
-        with self._lock:
-            return self._connected
+        return self._connected.is_set()
 
     def get_current_target(self) -> Optional[str]:
         """
@@ -333,8 +677,7 @@ class ChatClient:
 
             Returns: The target username if a chat is active, otherwise None.
         """
-        with self._lock:
-            return self._current_target
+        return self._current_target
 
     def open_chat(self, target: str) -> None:
         """
@@ -362,6 +705,18 @@ class ChatClient:
             self._current_target = target
         print(f"Now chatting with {target}. Type END to stop.")
 
+    def _target_prefix(self, target: str) -> bytes:
+        """
+            Return the encoded "TO <target> " prefix, cached for the last target it was built for.
+
+            Args:
+                target (str): The username messages are sent to.
+        """
+        if target != self._prefix_target:
+            self._prefix = _TO + target.encode("utf-8") + _SP
+            self._prefix_target = target
+        return self._prefix
+
     def end_current_chat(self) -> bool:
         """
         End the currently active chat session.
@@ -378,9 +733,8 @@ class ChatClient:
                   False -> failed to send END because the connection is lost
         """
 
-        # Read the active target safely (shared state between threads)
-        with self._lock:
-            target = self._current_target
+        # Read the active target once (a single attribute read is atomic, no lock needed)
+        target = self._current_target
 
         # If there is no active chat, nothing to end
         if not target:
@@ -389,7 +743,7 @@ class ChatClient:
 
         # Inform the server to end the chat with this target on BOTH sides
         # (server will send SYS END <me> to the other client).
-        if not self._safe_send(f"END {target}\n"):
+        if not self._safe_send(_END, target.encode("utf-8"), _NL):
             return False
 
         # Locally exit chat-mode:
@@ -423,9 +777,8 @@ class ChatClient:
                   False -> sending failed because the connection is lost
         """
 
-        # Read shared state safely (receiver thread may change _current_target)
-        with self._lock:
-            target = self._current_target
+        # Read the active target once (receiver thread may change _current_target afterwards)
+        target = self._current_target
 
         # If the user is not currently chatting with anyone, we cannot send a plain message.
         if not target:
@@ -433,7 +786,7 @@ class ChatClient:
             return True
 
         # Send to server using the protocol: TO <target> <message>\n
-        return self._safe_send(f"TO {target} {message}\n")
+        return self._safe_send(self._target_prefix(target), message.encode("utf-8"), _NL)
 
     def send_one_off(self, raw_to_command: str) -> bool:
         """
@@ -452,7 +805,7 @@ class ChatClient:
         if not raw_to_command.endswith("\n"):
             raw_to_command += "\n"
 
-        return self._safe_send(raw_to_command)
+        return self._safe_send(raw_to_command.encode("utf-8"))
 
     def close(self) -> None:
         """
@@ -460,14 +813,22 @@ class ChatClient:
 
         This is used when the user exits or when we detect a fatal connection issue.
         We wrap close() with try/except because closing an already-broken socket may raise OSError.
+
+        The socket is shut down first: this wakes up the receiver thread if it is blocked in recv.
         """
+        # Mark the client as disconnected and clear chat-related state
+        # (first, so the receiver thread knows the shutdown below is intentional)
+        self._set_disconnected()
+
         try:
-            self.sock.close()
+            self.sock.shutdown(socket.SHUT_RDWR)
         except OSError:
             pass
 
-        # Mark the client as disconnected and clear chat-related state
-        self._set_disconnected()
+        try:
+            self.sock.close()
+        except OSError:
+            pass
 
     # ----------------------------
     # CLI
@@ -485,6 +846,11 @@ class ChatClient:
             * END                    -> end current chat on both sides
             * exit / quit            -> disconnect and exit
         - If the connection is lost, the loop stops and the client closes gracefully.
+
+        On POSIX the socket and stdin are both watched by one selector in this thread
+        (see `_run_selector_loop`), so no receiver thread is needed. Where stdin cannot be
+        selected (Windows, or stdin is a pipe / file rather than a terminal) the receiver thread is
+        started and the CLI falls back to a blocking `input()` loop.
         """
 
         # Print help/usage for the user
@@ -495,58 +861,255 @@ class ChatClient:
         print("exit / quit              -> disconnect\n")
         print("Note: If someone messages you (FROM X ...), the chat auto-opens with X.\n")
 
+        selector = self._make_selector() if _SELECT_STDIN else None
+        if selector is not None:
+            self._run_selector_loop(selector)
+        else:
+            self.start_receiver()
+            self._run_input_loop()
+
+        # On exit, close socket and cleanup state
+        self.close()
+        print(f"[{self.name or 'Client'}] Disconnected.")
+
+    def _prompt(self) -> str:
+        """
+        Build the prompt: show active target if we are in chat-mode.
+        """
+        current_target = self.get_current_target()
+        return "> " if not current_target else f"[to {current_target}]> "
+
+    def _run_input_loop(self) -> None:
+        """
+        Blocking CLI loop: read each command with `input()` while the receiver thread
+        prints incoming messages.
+        """
         while True:
             # If connection dropped (detected by receiver thread / send failures), exit the CLI.
             if not self.is_connected():
                 print("[System] Connection lost. Exiting...")
                 break
 
-            # Build the prompt: show active target if we are in chat-mode
-            current_target = self.get_current_target()
-            prompt = "> " if not current_target else f"[to {current_target}]> "
-
-            # Read user command / message from terminal
-            user_input = input(prompt).strip()
+            # Read user command / message from terminal (EOF on stdin -> same as exit)
+            try:
+                user_input = input(self._prompt()).strip()
+            except EOFError:
+                break
             if not user_input:
                 continue
 
-            # Exit command
-            low = user_input.lower()
-            if low in ("exit", "quit"):
+            if not self._handle_input(user_input):
                 break
 
-            # END: end current chat on both sides via the server
-            if user_input.upper() == "END":
-                if not self.end_current_chat():
-                    break
-                continue
+    def _make_selector(self) -> Optional[selectors.BaseSelector]:
+        """
+        Create the selector that watches the server socket and stdin for readability.
+
+        Only an interactive terminal is watched: when stdin is a pipe or a file, `sys.stdin`
+        may already hold read-ahead lines (e.g. after the name was read with `input()`) that
+        the raw fd would never report, so the `input()` loop is used instead.
+
+        Returns:
+            Optional[selectors.BaseSelector]: The selector, or None if stdin is not a terminal
+                                              or cannot be registered.
+        """
+        if not sys.stdin.isatty():
+            return None
+
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+            selector.register(self.sock, selectors.EVENT_READ)
+        except (OSError, ValueError):
+            selector.close()
+            return None
+        return selector
+
+    def _run_selector_loop(self, selector: selectors.BaseSelector) -> None:
+        """
+        Single-threaded CLI loop driven by readiness events (epoll / kqueue / select).
+
+        - stdin readable        -> read the typed line(s) and run them as commands
+        - socket readable       -> receive and print server messages
+        - socket writable       -> write output the kernel could not accept earlier
+                                   (only watched while there is such pending output)
 
-            # TO: either open chat-mode or send a one-off message
-            if user_input.upper().startswith("TO "):
-                parts = user_input.split(maxsplit=2)
+        The socket is non-blocking for the duration of the loop and blocking again afterwards.
+        """
+        stdin_fd = sys.stdin.fileno()
+        self.sock.setblocking(False)
+        self._selector = selector
+        try:
+            # Lines that arrived together with the HELLO reply are already in the receive buffer;
+            # the selector would never report them, so handle them first.
+            self._handle_buffered_lines()
+            sys.stdout.write(self._prompt())
+            sys.stdout.flush()
+
+            running = True
+            while running:
+                # If connection dropped (detected on receive / send failures), exit the CLI.
+                if not self.is_connected():
+                    print("\n[System] Connection lost. Exiting...")
+                    break
 
-                # "TO <target>" -> open chat-mode (set active target)
-                if len(parts) == 2:
-                    target = parts[1].strip()
-                    if not target:
-                        print("Usage: TO <target> [message]")
+                for key, events in selector.select():
+                    if key.fd == stdin_fd:
+                        running = self._on_stdin_ready(stdin_fd)
+                        if not running:
+                            break
                         continue
-                    self.open_chat(target)
-                    continue
 
-                # "TO <target> <message>" -> one-off send (does not change active target)
-                else:
-                    if not self.send_one_off(user_input):
-                        break
-                    continue
+                    if events & selectors.EVENT_WRITE:
+                        # Write what is still pending (a zero-chunk send only flushes)
+                        self._safe_send()
+                    if events & selectors.EVENT_READ:
+                        self._on_recv_ready()
+        finally:
+            self._selector = None
+            selector.close()
+            try:
+                # Back to blocking mode so output that is still queued is written before closing
+                self.sock.setblocking(True)
+                if self._send_scratch and self.is_connected():
+                    self._flush()
+            except OSError:
+                pass
+
+    def _on_stdin_ready(self, stdin_fd: int) -> bool:
+        """
+        Read what the user typed and handle every complete line.
 
-            # Any other text is treated as a normal chat message for the current active target
-            if not self.send_to_current(user_input):
+        Args:
+            stdin_fd (int): File descriptor of stdin.
+
+        Returns:
+            bool: True to keep running, False to leave the CLI (exit / quit / EOF / connection lost).
+        """
+        data = os.read(stdin_fd, 4096)
+        buf = self._stdin_buf
+        if not data:
+            # EOF on stdin (Ctrl+D) -> run a last line typed without Enter, then same as exit
+            user_input = buf.decode("utf-8", errors="ignore").strip()
+            buf.clear()
+            if user_input:
+                self._handle_input(user_input)
+            return False
+
+        buf += data
+        start = 0
+        while True:
+            nl = buf.find(_NL, start)
+            if nl < 0:
                 break
+            user_input = buf[start:nl].decode("utf-8", errors="ignore").strip()
+            start = nl + 1
+            if user_input and not self._handle_input(user_input):
+                return False
+
+        # Print a new prompt only if at least one line was run
+        # (a partial line so far -> keep waiting for the rest of it)
+        if start:
+            del buf[:start]
+            sys.stdout.write(self._prompt())
+            sys.stdout.flush()
+        return True
 
-        # On exit, close socket and cleanup state
-        self.close()
-        print(f"[{self.name or 'Client'}] Disconnected.")
+    def _on_recv_ready(self) -> None:
+        """
+        Receive from the (non-blocking) socket and handle every complete line.
+
+        A read that returns less than requested means the kernel buffer is drained, so we go
+        back to waiting for the next readiness event instead of trying another recv.
+        """
+        handled = False
+        try:
+            while True:
+                size = self._recv_size
+                n = self._recv_some()
+                if not n:
+                    self._connection_lost("[System] Server closed the connection.")
+                    return
+
+                if self._handle_buffered_lines():
+                    handled = True
+
+                if n < size:
+                    break
+        except BlockingIOError:
+            # Nothing more to read right now
+            pass
+        except OSError:
+            # Socket error => treat as unexpected disconnect
+            self._connection_lost("[System] Disconnected from server (socket error).")
+            return
+
+        # Incoming messages were printed over the prompt -> show it again
+        if handled:
+            sys.stdout.write(self._prompt())
+            sys.stdout.flush()
+
+    def _handle_buffered_lines(self) -> bool:
+        """
+        Handle every complete line currently held in the receive buffer.
+
+        Returns:
+            bool: True if at least one line was handled.
+        """
+        handled = False
+        raw = self._next_line()
+        while raw is not None:
+            self._handle_line(raw)
+            handled = True
+            raw = self._next_line()
+        return handled
+
+    def _handle_input(self, user_input: str) -> bool:
+        """
+        Run one line typed by the user (already stripped, not empty).
+
+        Args:
+            user_input (str): The command or chat message.
+
+        Returns:
+            bool: True to keep running, False to leave the CLI (exit / quit / connection lost).
+        """
+
+        # Fast path for the common case (typing in chat-mode): input that cannot be a command
+        # is sent right away with the cached prefix, skipping the command parsing below.
+        # The target is read here because the receiver may have changed it while the user typed.
+        current_target = self.get_current_target()
+        if current_target and user_input[0] not in _COMMAND_START:
+            return self._safe_send(self._target_prefix(current_target), user_input.encode("utf-8"), _NL)
+
+        # Exit command
+        low = user_input.lower()
+        if low in ("exit", "quit"):
+            return False
+
+        # END: end current chat on both sides via the server
+        if user_input.upper() == "END":
+            return self.end_current_chat()
+
+        # TO: either open chat-mode or send a one-off message
+        if user_input.upper().startswith("TO "):
+            parts = user_input.split(maxsplit=2)
+
+            # "TO <target>" -> open chat-mode (set active target)
+            if len(parts) == 2:
+                target = parts[1].strip()
+                if not target:
+                    print("Usage: TO <target> [message]")
+                    return True
+                self.open_chat(target)
+                return True
+
+            # "TO <target> <message>" -> one-off send (does not change active target)
+            else:
+                return self.send_one_off(user_input)
+
+        # Any other text is treated as a normal chat message for the current active target
+        return self.send_to_current(user_input)
 
 
 
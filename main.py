@@ -13,8 +13,9 @@ def main() -> None:
     4) Perform HELLO handshake in a retry loop until:
        - success ("OK"), or
        - fatal exit ("EXIT") such as server full / connection lost.
-    5) Start the receiver thread so incoming messages are printed immediately.
-    6) Run the interactive CLI loop until the user quits or the connection drops.
+    5) Run the interactive CLI loop until the user quits or the connection drops.
+       Incoming messages are printed immediately (the CLI watches the socket and stdin together,
+       or starts the receiver thread where stdin cannot be watched).
     """
 
     # Create the client instance (holds socket + state)
@@ -54,10 +55,7 @@ def main() -> None:
         # Otherwise status == "RETRY": ask for another name
         name = input("Invalid / taken name. Choose another name: ").strip()
 
-    # 4) Start background receiver thread (prints incoming messages while we type)
-    client.start_receiver()
-
-    # 5) Run the command-line interface loop
+    # 4) Run the command-line interface loop
     client.run_cli()
 
 